@@ -9,22 +9,33 @@ branch is kept open.  Each <pre><code> block gets a "Copy" button powered by a
 4-line inline JS helper.  No other JavaScript is included.
 
 Dependencies (install via pip):
-    markdown pygments
+    pyromark pygments
 
 Usage (from project root):
     python generate.py               # uses ./content → ./site
     python generate.py -i docs -o build
+    python generate.py --cache-dir ""  # disable the render cache
 """
 
 import argparse
+import functools
+import hashlib
+import html
 import os
 import re
 import shutil
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Set, Tuple
 
-import markdown
+import pygments
+import pyromark
+from pygments import highlight
 from pygments.formatters import HtmlFormatter
+from pygments.lexers import get_lexer_by_name
+from pygments.lexer import Lexer
+from pygments.lexers.special import TextLexer
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -33,6 +44,8 @@ from pygments.formatters import HtmlFormatter
 DEFAULT_INPUT_DIR = Path("content")
 DEFAULT_OUTPUT_DIR = Path("site")
 ASSETS_DIR = Path("assets")  # Folder with global assets to be copied verbatim
+DEFAULT_CACHE_DIR = Path(".knowhow-cache")  # Rendered Markdown, keyed by content hash
+PYGMENTS_STYLE = "default"  # Colour scheme for highlighted code
 
 # ---------------------------------------------------------------------------
 # HTML Template - IMPORTANT: Keep this template formatted with proper indentation
@@ -42,8 +55,8 @@ TEMPLATE = """<!doctype html>
 <head>
   <meta charset="utf-8"/>
   <meta name="viewport" content="width=device-width,initial-scale=1"/>
-  <base href="{base_href}"/>
-  <title>{title}</title>
+  <base href="{{ base_href }}"/>
+  <title>{{ title }}</title>
   <link rel="icon" href="favicon.ico" type="image/x-icon">
   <link rel="manifest" href="manifest.json" />
   <link rel="stylesheet" href="static/style.css"/>
@@ -52,39 +65,63 @@ TEMPLATE = """<!doctype html>
   <button class="menu-btn" onclick="toggleNav()">☰</button>
   <div class="layout">
     <nav class="sidebar">
-      {nav}
+      {{ nav }}
     </nav>
     <main>
-      {body}
+      {{ body }}
     </main>
   </div>
   <script>
-    function copyCode(btn) {{
+    function copyCode(btn) {
       const code = btn.nextElementSibling.innerText;
-      navigator.clipboard.writeText(code).then(() => {{
+      navigator.clipboard.writeText(code).then(() => {
         btn.textContent = 'Copied!';
         setTimeout(() => btn.textContent = 'Copy', 2000);
         
-      }});
-    }}
+      });
+    }
 
-    function toggleNav() {{
+    function toggleNav() {
       const sidebar = document.querySelector('.sidebar');
       sidebar.classList.toggle('open');
-    }}
+    }
 
-    document.addEventListener('DOMContentLoaded', () => {{
+    document.addEventListener('DOMContentLoaded', () => {
       const sidebar = document.querySelector('.sidebar');
-      sidebar.addEventListener('click', (e) => {{
-        if (e.target.tagName === 'A') {{
+      sidebar.addEventListener('click', (e) => {
+        if (e.target.tagName === 'A') {
           sidebar.classList.remove('open');
-        }}
-      }});
-    }});
+        }
+      });
+    });
   </script>
 </body>
 </html>"""
 
+_PLACEHOLDER_RE = re.compile(r"\{\{ (\w+) \}\}")
+
+
+def _compile_template(template: str, params: Tuple[str, ...]):
+    """Turn template into a function that joins its literal text with the arguments.
+
+    The generated code is just ''.join((literal, arg, literal, ...)) with the
+    literals baked in as constants; values are inserted as-is (already HTML).
+    """
+    pieces = _PLACEHOLDER_RE.split(template)  # literal, name, literal, name, ..., literal
+    unknown = set(pieces[1::2]) - set(params)
+    if unknown:
+        raise ValueError(f"Unknown template placeholders: {', '.join(sorted(unknown))}")
+    items = ", ".join(piece if i % 2 else repr(piece) for i, piece in enumerate(pieces))
+    source = f"def render_page({', '.join(params)}):\n    return ''.join(({items},))\n"
+    namespace: Dict[str, object] = {}
+    exec(compile(source, "<page template>", "exec"), namespace)
+    return namespace["render_page"]
+
+
+# render_page(base_href, title, nav, body) -> str
+render_page = _compile_template(TEMPLATE, ("base_href", "title", "nav", "body"))
+
+
 # ---------------------------------------------------------------------------
 # CSS Styles - IMPORTANT: Maintain this CSS with proper formatting and indentation
 # ---------------------------------------------------------------------------
@@ -239,6 +276,10 @@ pre, code {
   }
 }
 
+.codehilite {
+  position: relative;
+}
+
 .copy-btn {
   position: absolute;
   top: 6px;
@@ -304,9 +345,11 @@ pre, code {
 class Node:
     """Represents a directory or markdown file in the nav tree."""
 
-    def __init__(self, name: str, path: Path, is_dir: bool):
+    __slots__ = ("name", "path_str", "is_dir", "children")
+
+    def __init__(self, name: str, path_str: str, is_dir: bool):
         self.name = name
-        self.path = path  # absolute path
+        self.path_str = path_str  # as returned by os.scandir (content root included)
         self.is_dir = is_dir
         self.children: List["Node"] = []  # for dirs only
 
@@ -318,140 +361,361 @@ class Node:
 # Tree construction and nav rendering
 # ---------------------------------------------------------------------------
 
-def build_tree(root: Path) -> Node:
+def _scan(path) -> Iterator[Tuple[os.DirEntry, bool]]:
+    """Yield (entry, is_dir) for a directory; DirEntry caches the type, so no extra stat()."""
+    with os.scandir(path) as it:
+        for entry in it:
+            yield entry, entry.is_dir()
+
+
+def build_tree(root: str) -> Node:
     """Recursively build a tree mirroring the directory structure."""
-    root_node = Node(root.name, root, True)
-    for child in sorted(root.iterdir(), key=lambda p: (p.is_file(), p.name.lower())):
-        if child.is_dir():
-            root_node.add_child(build_tree(child))
-        elif child.suffix.lower() == ".md":
-            root_node.add_child(Node(child.stem, child, False))
+    root_node = Node(os.path.basename(root), root, True)
+    for entry, is_dir in sorted(_scan(root), key=lambda e: (not e[1], e[0].name.lower())):
+        if is_dir:
+            root_node.add_child(build_tree(entry.path))
+        elif entry.name.lower().endswith(".md") and entry.is_file():
+            root_node.add_child(Node(os.path.splitext(entry.name)[0], entry.path, False))
     return root_node
 
 
-def render_nav(node: Node, current_md: Optional[Path], root: Path, depth: int = 0) -> str:
-    """Return HTML nav markup with inline indentation based on depth."""
+def _rel_posix(path: str, root: str) -> str:
+    """Path below root as a '/'-separated relative path (path must come from scanning root)."""
+    rel = path[len(root) + 1:]
+    return rel if os.sep == "/" else rel.replace(os.sep, "/")
+
+
+def _walk_files(root) -> Iterator[os.DirEntry]:
+    """Recursively yield every regular file below root.
+
+    Files of a directory come before its sub-directories (same order as rglob).
+    Broken symlinks, FIFOs and sockets are skipped, like rglob + is_file() did.
+    """
+    sub_dirs = []
+    for entry, is_dir in _scan(root):
+        if is_dir:
+            sub_dirs.append(entry.path)
+        elif entry.is_file():
+            yield entry
+    for sub_dir in sub_dirs:
+        yield from _walk_files(sub_dir)
+
+
+# Tokens are NUL-delimited: NUL cannot occur in a path, so any file name is safe
+_NAV_TOKEN_RE = re.compile("\0[AD]:[^\0]*\0")
+
+# html.escape(quote=True) as a C-level lookup table, for names and paths in the nav
+_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+
+def render_nav_template(node: Node, root: str, depth: int = 0) -> str:
+    """Return page-independent nav markup with inline indentation based on depth.
+
+    Instead of the active/open attributes every link carries a \\0A:relpath\\0 token
+    and every folder a \\0D:relpath\\0 token; activate_nav() fills them in per page.
+    """
     indent_px = depth * 16  # 1rem ≈ 16px
     style_attr = f" style=\"margin-left:{indent_px}px\"" if depth else ""
+    rel_path = _rel_posix(node.path_str, root)
+    name = node.name.translate(_ESC)
 
     if node.is_dir:
-        # Determine if this folder needs to be open
-        open_attr = " open" if current_md and current_md.is_relative_to(node.path) else ""
-        parts = [f"<details{open_attr}{style_attr}><summary title=\"{node.name}\">{node.name}</summary>"]
+        parts = [f"<details\0D:{rel_path}\0{style_attr}><summary title=\"{name}\">{name}</summary>"]
         for child in node.children:
-            parts.append(render_nav(child, current_md, root, depth + 1))
+            parts.append(render_nav_template(child, root, depth + 1))
         parts.append("</details>")
         return "\n".join(parts)
     else:
-        rel_md_path = node.path.relative_to(root)
-        html_href = rel_md_path.with_suffix(".html")
-        class_attr = " class=\"active\"" if current_md and rel_md_path == current_md.relative_to(root) else ""
-        return f"<a href=\"{html_href.as_posix()}\"{class_attr}{style_attr} title=\"{node.name}\">{node.name}</a>"
+        html_href = (rel_path[:-3] + ".html").translate(_ESC)
+        return f"<a href=\"{html_href}\"\0A:{rel_path}\0{style_attr} title=\"{name}\">{name}</a>"
+
+
+def activate_nav(template: str, rel_md: str) -> str:
+    """Highlight the current page and open its folders, dropping all other tokens."""
+    nav = template.replace(f"\0A:{rel_md}\0", " class=\"active\"")
+    folder = rel_md.rpartition("/")[0]
+    while folder:  # stops at the content root itself
+        nav = nav.replace(f"\0D:{folder}\0", " open")
+        folder = folder.rpartition("/")[0]
+    return _NAV_TOKEN_RE.sub("", nav)
 
 
 # ---------------------------------------------------------------------------
 # Markdown → HTML with copy buttons
 # ---------------------------------------------------------------------------
 
-def md_to_html(text: str, formatter: HtmlFormatter) -> str:
+PYROMARK_OPTIONS = (
+    pyromark.Options.ENABLE_TABLES
+    | pyromark.Options.ENABLE_FOOTNOTES
+    | pyromark.Options.ENABLE_STRIKETHROUGH
+    | pyromark.Options.ENABLE_TASKLISTS
+)
+
+# Compiled once per process instead of on every re.sub call
+_JEKYLL_RE = re.compile(r'{%\s*highlight\s+(\w+)\s*%}(.*?){%\s*endhighlight\s*%}', re.DOTALL)
+_CODE_RE = re.compile(r'<pre><code(?: class="language-([^"]+)")?>(.*?)</code></pre>\n?', re.DOTALL)
+_HEADING_RE = re.compile(r"<h([1-6])([^>]*)>(.*?)</h\1>")
+_TAG_RE = re.compile(r"<[^>]+>")
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_HYPHEN_RE = re.compile(r"[-\s]+")
+_SLUG_COUNT_RE = re.compile(r"^(.*)_([0-9]+)$")
+
+# Same markup codehilite produced: <div class="codehilite"><pre><span></span><code>…
+_FORMATTER = HtmlFormatter(style=PYGMENTS_STYLE, cssclass="codehilite", wrapcode=True)
+_LEXER_CACHE: Dict[str, Lexer] = {}  # language name → lexer, resolved once per process
+_BLOCK_OPEN = "<div class=\"codehilite\">"
+_COPY_BTN = "<button class=\"copy-btn\" onclick=\"copyCode(this)\">Copy</button>"
+
+
+def _highlight_block(match) -> str:
+    """Replace one pyromark <pre><code> block with highlighted markup and a copy button."""
+    lang, code = match.group(1) or "text", html.unescape(match.group(2))
+    lexer = _LEXER_CACHE.get(lang)
+    if lexer is None:
+        try:
+            lexer = get_lexer_by_name(lang)
+        except ValueError:  # unknown language → plain text, like codehilite with guess_lang=False
+            lexer = TextLexer()
+        _LEXER_CACHE[lang] = lexer
+    # Button sits right before <pre>, which is what copyCode() reads via nextElementSibling
+    return _BLOCK_OPEN + _COPY_BTN + highlight(code, lexer, _FORMATTER)[len(_BLOCK_OPEN):]
+
+
+def _slugify(value: str, used: Set[str]) -> str:
+    """Heading id in the style of python-markdown's toc extension (unique per page)."""
+    value = html.unescape(_TAG_RE.sub("", value))
+    value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    slug = _SLUG_HYPHEN_RE.sub("-", _SLUG_STRIP_RE.sub("", value).strip().lower())
+    # Same as toc's unique(): bump a trailing _N until the id is non-empty and unused
+    while slug in used or not slug:
+        match = _SLUG_COUNT_RE.match(slug)
+        slug = f"{match.group(1)}_{int(match.group(2)) + 1}" if match else f"{slug}_1"
+    used.add(slug)
+    return slug
+
+
+def md_to_html(text: str) -> Tuple[str, Optional[str]]:
+    """Return the page body HTML and its title (first h1-h3, None if there is none)."""
     # Convert Jekyll-style code blocks to standard markdown code blocks
-    text = re.sub(r'{%\s*highlight\s+(\w+)\s*%}(.*?){%\s*endhighlight\s*%}', 
-                 r'```\1\2```', 
-                 text, 
-                 flags=re.DOTALL)
-    
-    md = markdown.Markdown(extensions=[
-        "fenced_code",
-        "tables",
-        "toc",
-        "codehilite",  # adds Pygments classes
-    ], extension_configs={
-        "codehilite": {
-            "guess_lang": False,
-            "use_pygments": True,
-            "noclasses": False,
-        }
-    })
-    html = md.convert(text)
-    # Inject copy buttons before each <pre><code>
-    def _inject(match):
-        return ("<button class=\"copy-btn\" onclick=\"copyCode(this)\">Copy</button>" + match.group(0))
-
-    html = re.sub(r"<pre><code[\s\S]*?</code></pre>", _inject, html)
-    return html
+    text = _JEKYLL_RE.sub(r'```\1\2```', text)
+
+    html_out = pyromark.html(text, options=PYROMARK_OPTIONS)
+    # Syntax highlighting and copy buttons as a post-pass (pyromark has no codehilite equivalent)
+    html_out = _CODE_RE.sub(_highlight_block, html_out)
+    # Keep the heading anchors the toc extension used to add; grab the title on the way
+    used: Set[str] = set()
+    title = None
+
+    def _anchor(match):
+        nonlocal title
+        level, attrs, inner = match.groups()
+        if title is None and level in "123":
+            title = inner
+        if attrs:  # raw HTML heading; leave its attributes alone
+            return match.group(0)
+        return f"<h{level} id=\"{_slugify(inner, used)}\">{inner}</h{level}>"
+
+    html_out = _HEADING_RE.sub(_anchor, html_out)
+    return html_out, title
+
+
+@functools.lru_cache(maxsize=8)
+def _pygments_css(style: str) -> str:
+    """CSS rules for highlighted code; reuses the highlighting formatter for its own style."""
+    formatter = _FORMATTER if style == PYGMENTS_STYLE else HtmlFormatter(style=style)
+    return formatter.get_style_defs(".codehilite")
+
+
+# Everything that influences md_to_html output; bump _CACHE_VERSION when the
+# post-processing above changes so stale cache entries are ignored.
+_CACHE_VERSION = 4
+_CACHE_TAG = (
+    f"v{_CACHE_VERSION}|pyromark {pyromark.__version__}|{int(PYROMARK_OPTIONS)}"
+    f"|pygments {pygments.__version__}|{_FORMATTER.cssclass}\n"
+).encode("utf-8")
+_CACHE_HASH = hashlib.blake2b(_CACHE_TAG, digest_size=16)
+
+
+# Names of cache entries and of their write-then-rename temp files; nothing else is pruned
+_CACHE_FILE_RE = re.compile(r"[0-9a-f]{32}\.html(?:\.\d+\.tmp)?")
+
+
+def cache_name(source: bytes) -> str:
+    """File name of the render cache entry for source under the current config."""
+    digest = _CACHE_HASH.copy()
+    digest.update(source)
+    return digest.hexdigest() + ".html"
+
+
+def cached_md_to_html(source: bytes, cache_dir: Optional[str]) -> Tuple[str, Optional[str], Optional[str]]:
+    """md_to_html with an on-disk cache keyed by a hash of source and config.
+
+    Returns (body_html, title, cache entry name); the name is None without a cache.
+    A cache file holds the title on its first line (empty if none), then the body.
+    """
+    if cache_dir is None:
+        return (*md_to_html(source.decode("utf-8")), None)
+
+    name = cache_name(source)
+    cache_path = os.path.join(cache_dir, name)
+    try:
+        with open(cache_path, "rb") as f:
+            title, body_html = f.read().decode("utf-8").split("\n", 1)
+            return body_html, title or None, name
+    except (OSError, ValueError):  # missing, unreadable or damaged entry → render again
+        pass
+
+    body_html, title = md_to_html(source.decode("utf-8"))
+    # Write-then-rename so a worker rendering an identical page never reads a partial file
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(f"{title or ''}\n{body_html}".encode("utf-8"))
+    os.replace(tmp_path, cache_path)
+    return body_html, title, name
 
 
 # ---------------------------------------------------------------------------
 # Site generation
 # ---------------------------------------------------------------------------
 
-def generate_site(input_dir: Path, output_dir: Path):
-    if output_dir.exists():
-        shutil.rmtree(output_dir)
-    (output_dir / "static").mkdir(parents=True, exist_ok=True)
+_NAV_TEMPLATE = ""  # set once per worker process by _init_worker
 
-    # Prepare CSS (base + pygments theme)
-    formatter = HtmlFormatter(style="default")
-    pygments_css = formatter.get_style_defs(".codehilite")
-    css_path = output_dir / "static" / "style.css"
-    css_path.write_text(BASE_CSS + "\n" + pygments_css, encoding="utf8")
 
-    tree = build_tree(input_dir)
+def _init_worker(nav_template: str):
+    """Hand the page-independent nav to a worker once instead of pickling it per page."""
+    global _NAV_TEMPLATE
+    _NAV_TEMPLATE = nav_template
 
-    for md_path in input_dir.rglob("*.md"):
-        rel_md = md_path.relative_to(input_dir)
-        html_out_path = output_dir / rel_md.with_suffix(".html")
-        html_out_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Calculate base href for this page (to reach site root)
-        depth = len(rel_md.parts) - 1  # How many directories deep is this file
-        base_href = "../" * depth if depth > 0 else "./"
+def _render_one(task) -> Tuple[str, Optional[str]]:
+    """Render a single Markdown page; runs in a worker process.
 
-        body_html = md_to_html(md_path.read_text(encoding="utf8"), formatter)
-        title = extract_title(body_html) or md_path.stem
-        
-        # Exclude the content root folder itself from the sidebar; start at its children
-        nav_html = "\n".join(
-            render_nav(child, md_path, input_dir, depth=0) for child in tree.children
-        )
-        page_html = TEMPLATE.format(title=title, nav=nav_html, body=body_html, base_href=base_href)
+    Returns the progress line and the page's cache entry name (None without cache).
+    """
+    md_path, rel_md, output_dir, cache_dir = task
+    rel_html = rel_md[:-3] + ".html"
+    html_out_path = os.path.join(output_dir, rel_html)  # folder made by generate_site
+
+    # Calculate base href for this page (to reach site root)
+    depth = rel_md.count("/")  # How many directories deep is this file
+    base_href = "../" * depth if depth > 0 else "./"
 
-        html_out_path.write_text(page_html, encoding="utf8")
-        print(f"✓ {rel_md} → {html_out_path.relative_to(output_dir)}")
+    with open(md_path, "rb") as f:
+        source = f.read()
+    body_html, title, name = cached_md_to_html(source, cache_dir)
+    title = title or os.path.splitext(os.path.basename(md_path))[0].translate(_ESC)
+
+    nav_html = activate_nav(_NAV_TEMPLATE, rel_md)
+    page_html = render_page(base_href, title, nav_html, body_html)
+
+    with open(html_out_path, "wb") as f:
+        f.write(page_html.encode("utf-8"))
+    return f"✓ {rel_md} → {rel_html}", name
+
+
+def generate_site(input_dir: Path, output_dir: Path, cache_dir: Optional[Path] = None):
+    if output_dir.exists():
+        shutil.rmtree(output_dir)
+    (output_dir / "static").mkdir(parents=True, exist_ok=True)
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # Prepare CSS (base + pygments theme)
+    pygments_css = _pygments_css(PYGMENTS_STYLE)
+    css_bytes = (BASE_CSS + "\n" + pygments_css).encode("utf-8")
+    fd = os.open(output_dir / "static" / "style.css", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(css_bytes)
+        while view:  # os.write may write less than asked for
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+    # Below this point paths are plain strings: Path objects are slow in the per-file loops
+    input_str, output_str, assets_str = str(input_dir), str(output_dir), str(ASSETS_DIR)
+    cache_str = str(cache_dir) if cache_dir is not None else None
+
+    tree = build_tree(input_str)
+
+    # One traversal of the content folder: Markdown pages vs. other assets ('/'-separated, relative)
+    md_files: List[str] = []
+    content_assets: List[str] = []
+    for entry in _walk_files(input_str):
+        if entry.name.lower().endswith(".md"):
+            md_files.append(_rel_posix(entry.path, input_str))
+        else:
+            content_assets.append(_rel_posix(entry.path, input_str))
+    global_assets = [_rel_posix(entry.path, assets_str) for entry in _walk_files(assets_str)] if ASSETS_DIR.exists() else []
+
+    # Create the output folder skeleton once, so the loops below never call mkdir
+    out_dirs = {rel.rpartition("/")[0] for rel in md_files + content_assets + global_assets}
+    for rel_dir in sorted(out_dirs):
+        os.makedirs(os.path.join(output_str, rel_dir), exist_ok=True)
+
+    # Exclude the content root folder itself from the sidebar; start at its children.
+    # Rendered once; each page only splices in its active link and open folders.
+    nav_template = "\n".join(render_nav_template(child, input_str) for child in tree.children)
+
+    # Pages are independent of each other → render them on all cores
+    tasks = [
+        (os.path.join(input_str, rel_md), rel_md, output_str, cache_str)
+        for rel_md in md_files
+    ]
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(nav_template,)) as ex:
+        used_cache = set()
+        for line, name in ex.map(_render_one, tasks, chunksize=8):
+            used_cache.add(name)
+            print(line)
+
+    # Drop cache entries (and stray .tmp files) this build did not use, so the cache
+    # holds only the current pages instead of growing with every edit. Only our own
+    # file names are touched, in case --cache-dir points at a folder with other files.
+    if cache_str is not None:
+        for entry, is_dir in _scan(cache_str):
+            if not is_dir and entry.name not in used_cache and _CACHE_FILE_RE.fullmatch(entry.name):
+                os.remove(entry.path)
 
     # Optional: copy non-md assets (e.g., images) maintaining structure
-    for asset in input_dir.rglob("*"):
-        if asset.is_file() and asset.suffix.lower() not in {".md"}:
-            dest = output_dir / asset.relative_to(input_dir)
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(asset, dest)
+    for rel in content_assets:
+        _fast_copy(os.path.join(input_str, rel), os.path.join(output_str, rel))
 
     # -----------------------------------------------------------
     # Copy global assets (favicon, manifest, images, etc.)
     # -----------------------------------------------------------
-    if ASSETS_DIR.exists():
-        for asset in ASSETS_DIR.rglob("*"):
-            if asset.is_file():
-                dest = output_dir / asset.relative_to(ASSETS_DIR)
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(asset, dest)
-                print(f"⇢ assets/{asset.relative_to(ASSETS_DIR)} → {dest.relative_to(output_dir)}")
+    for rel in global_assets:
+        _fast_copy(os.path.join(assets_str, rel), os.path.join(output_str, rel))
+        print(f"⇢ assets/{rel} → {rel}")
 
     # Write index.html redirecting to first article (if any)
-    first_page = next((p for p in input_dir.rglob("*.md")), None)
-    if first_page:
-        first_html = first_page.relative_to(input_dir).with_suffix(".html")
+    if md_files:
+        first_html = (md_files[0][:-3] + ".html").translate(_ESC)
         idx_path = output_dir / "index.html"
-        idx_path.write_text(f"<meta http-equiv=\"refresh\" content=\"0; url={first_html.as_posix()}\">", encoding="utf8")
+        idx_path.write_text(f"<meta http-equiv=\"refresh\" content=\"0; url={first_html}\">", encoding="utf8")
 
 
 # ---------------------------------------------------------------------------
 # Utilities
 # ---------------------------------------------------------------------------
 
-def extract_title(html: str) -> Optional[str]:
-    match = re.search(r"<h[1-3][^>]*>(.*?)</h[1-3]>", html)
-    return match.group(1) if match else None
+def _fast_copy(src: str, dst: str):
+    """Like shutil.copy2, but let the kernel copy the data (reflink/zero-copy) when it can."""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining > 0:
+                raise OSError("copy_file_range stopped early")
+        except OSError:
+            # e.g. cross-device on old kernels; copyfile uses os.sendfile on Linux
+            shutil.copyfile(src, dst)
+    else:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
 
 
 # ---------------------------------------------------------------------------
@@ -462,10 +726,11 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate a static site from Markdown.")
     parser.add_argument("-i", "--input", default=DEFAULT_INPUT_DIR, type=Path, help="Markdown source directory (default: ./content)")
     parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT_DIR, type=Path, help="Output directory (default: ./site)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR), help="Render cache directory, empty to disable; entries not used by a build are removed (default: ./.knowhow-cache)")
     args = parser.parse_args()
 
     if not args.input.exists():
         parser.error(f"Input directory {args.input} does not exist.")
 
-    generate_site(args.input, args.output)
+    generate_site(args.input, args.output, Path(args.cache_dir) if args.cache_dir else None)
     print(f"\nSite generated at {args.output.resolve()}") 
\ No newline at end of file